@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from xml.sax.saxutils import escape
 from zipfile import ZIP_DEFLATED, ZipFile
@@ -14,33 +15,37 @@ def _col_name(index: int) -> str:
     return letters
 
 
-def _cell_ref(row: int, col: int) -> str:
-    return f"{_col_name(col)}{row}"
+# Excel caps a sheet at 16384 columns (XFD); wider rows fall back to _col_name.
+_COL_NAMES = [_col_name(col_index) for col_index in range(1, 16385)]
 
 
-def _render_cell(row: int, col: int, value: object) -> str:
-    ref = _cell_ref(row, col)
-    if isinstance(value, (int, float)) and not isinstance(value, bool):
-        return f'<c r="{ref}"><v>{value}</v></c>'
-    text = escape("" if value is None else str(value))
-    return f'<c r="{ref}" t="inlineStr"><is><t>{text}</t></is></c>'
-
-
-def _sheet_xml(rows: list[list[object]]) -> str:
-    row_xml: list[str] = []
-    for row_index, row_values in enumerate(rows, start=1):
-        cells = "".join(_render_cell(row_index, col_index, val) for col_index, val in enumerate(row_values, start=1))
-        row_xml.append(f'<row r="{row_index}">{cells}</row>')
-    sheet_data = "".join(row_xml)
-    return (
+def _iter_sheet_xml(rows: Iterable[list[object]], batch_size: int = 1000) -> Iterator[str]:
+    yield (
         '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
         '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
-        f"<sheetData>{sheet_data}</sheetData>"
-        "</worksheet>"
+        "<sheetData>"
     )
+    col_names = _COL_NAMES
+    row_xml: list[str] = []
+    for row_index, row_values in enumerate(rows, start=1):
+        if len(row_values) > len(col_names):
+            col_names = col_names + [_col_name(col_index) for col_index in range(len(col_names) + 1, len(row_values) + 1)]
+        cells = "".join(
+            f'<c r="{col_names[col]}{row_index}"><v>{value}</v></c>'
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+            else f'<c r="{col_names[col]}{row_index}" t="inlineStr"><is><t>{escape("" if value is None else str(value))}</t></is></c>'
+            for col, value in enumerate(row_values)
+        )
+        row_xml.append(f'<row r="{row_index}">{cells}</row>')
+        if len(row_xml) >= batch_size:
+            yield "".join(row_xml)
+            row_xml = []
+    if row_xml:
+        yield "".join(row_xml)
+    yield "</sheetData></worksheet>"
 
 
-def write_excel(path: Path, rows: list[list[object]]) -> None:
+def write_excel(path: Path, rows: Iterable[list[object]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with ZipFile(path, "w", compression=ZIP_DEFLATED) as zf:
         zf.writestr(
@@ -79,4 +84,6 @@ def write_excel(path: Path, rows: list[list[object]]) -> None:
             'Target="worksheets/sheet1.xml"/>'
             "</Relationships>",
         )
-        zf.writestr("xl/worksheets/sheet1.xml", _sheet_xml(rows))
+        with zf.open("xl/worksheets/sheet1.xml", "w") as handle:
+            for chunk in _iter_sheet_xml(rows):
+                handle.write(chunk.encode("utf-8"))
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
-from financial_digitization.models.contracts import ExtractionBlock
+from financial_digitization.models.contracts import ExtractionBlock, ExtractionBlockTuple
+
+_DEFAULT_BBOX: tuple[float, ...] = (0.0, 0.0, 1.0, 1.0)
 
 
 class PDFTextExtractor:
     def extract(self, page_texts: list[str]) -> list[ExtractionBlock]:
         return [
-            ExtractionBlock(page=i + 1, text=text, bbox=[0, 0, 1, 1], source="pdf_text", confidence=0.99)
+            ExtractionBlock(page=i + 1, text=text, bbox=_DEFAULT_BBOX, source="pdf_text", confidence=0.99)
             for i, text in enumerate(page_texts)
         ]
 
+    def extract_raw(self, page_texts: list[str]) -> list[ExtractionBlockTuple]:
+        return [ExtractionBlockTuple(i + 1, text, _DEFAULT_BBOX, "pdf_text", 0.99) for i, text in enumerate(page_texts)]
+
 
 class OCRExtractor:
     def extract(self, ocr_texts: list[str]) -> list[ExtractionBlock]:
         return [
-            ExtractionBlock(page=i + 1, text=text, bbox=[0, 0, 1, 1], source="ocr", confidence=0.85)
+            ExtractionBlock(page=i + 1, text=text, bbox=_DEFAULT_BBOX, source="ocr", confidence=0.85)
             for i, text in enumerate(ocr_texts)
         ]
+
+    def extract_raw(self, ocr_texts: list[str]) -> list[ExtractionBlockTuple]:
+        return [ExtractionBlockTuple(i + 1, text, _DEFAULT_BBOX, "ocr", 0.85) for i, text in enumerate(ocr_texts)]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 
 try:
@@ -10,67 +13,93 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency at runtime
     PdfReader = None
 
 _COLUMN_SPLIT_RE = re.compile(r"\t+|\s{2,}")
+# Below this many pages, worker start-up costs more than parallel extraction saves.
+_PARALLEL_MIN_PAGES = 16
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtractedTable:
     page: int
     index: int
     rows: list[list[str]]
 
 
-def extract_page_texts(pdf_path: Path) -> list[str]:
+def iter_page_texts(pdf_path: Path, start: int = 0, stop: int | None = None) -> Iterator[str]:
     if PdfReader is None:
-        return []
+        return
     try:
         reader = PdfReader(str(pdf_path))
     except Exception:  # pragma: no cover - parser/runtime fallback
-        return []
+        return
 
-    extracted_texts: list[str] = []
-    for page in reader.pages:
+    pages = reader.pages
+    end = len(pages) if stop is None else min(stop, len(pages))
+    for page_index in range(start, end):
         try:
-            extracted_texts.append((page.extract_text() or "").strip())
+            yield (pages[page_index].extract_text() or "").strip()
         except Exception:  # pragma: no cover - page-level extraction fallback
-            extracted_texts.append("")
-    return extracted_texts
+            yield ""
+
+
+def extract_page_texts(pdf_path: Path, max_workers: int | None = None) -> list[str]:
+    """Return each page's text; parallel extraction is opt-in via max_workers > 1 and only used for long PDFs."""
+    page_count = _page_count(pdf_path) if max_workers and max_workers > 1 else 0
+    if page_count < _PARALLEL_MIN_PAGES:
+        return list(iter_page_texts(pdf_path))
 
+    step = -(-page_count // max_workers)
+    starts = range(0, page_count, step)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunks = executor.map(_extract_page_range, repeat(pdf_path), starts, [start + step for start in starts])
+        return [text for chunk in chunks for text in chunk]
 
-def extract_tables(pdf_path: Path, page_texts: list[str] | None = None) -> list[ExtractedTable]:
+
+def _extract_page_range(pdf_path: Path, start: int, stop: int) -> list[str]:
+    return list(iter_page_texts(pdf_path, start, stop))
+
+
+def _page_count(pdf_path: Path) -> int:
+    if PdfReader is None:
+        return 0
+    try:
+        return len(PdfReader(str(pdf_path)).pages)
+    except Exception:  # pragma: no cover - parser/runtime fallback
+        return 0
+
+
+def extract_tables(pdf_path: Path, page_texts: Iterable[str] | None = None) -> list[ExtractedTable]:
     tables = _extract_tables_with_pdfplumber(pdf_path)
     if tables:
         return tables
-    return extract_tables_from_text(page_texts if page_texts is not None else extract_page_texts(pdf_path))
+    return extract_tables_from_text(page_texts if page_texts is not None else iter_page_texts(pdf_path))
 
 
-def extract_tables_from_text(page_texts: list[str]) -> list[ExtractedTable]:
+def extract_tables_from_text(page_texts: Iterable[str]) -> list[ExtractedTable]:
     tables: list[ExtractedTable] = []
 
     for page_index, text in enumerate(page_texts, start=1):
         next_table_index = 1
         current_rows: list[list[str]] = []
+        width = 0
 
         for raw_line in text.splitlines():
             line = raw_line.strip()
-            if not line:
-                if current_rows:
-                    tables.append(ExtractedTable(page=page_index, index=next_table_index, rows=_pad_rows(current_rows)))
-                    next_table_index += 1
-                    current_rows = []
-                continue
-
-            columns = [chunk.strip() for chunk in _COLUMN_SPLIT_RE.split(line) if chunk.strip()]
+            # Blank and single-column lines both close the table in progress.
+            columns = [chunk for chunk in map(str.strip, _COLUMN_SPLIT_RE.split(line)) if chunk] if line else []
             if len(columns) >= 2:
                 current_rows.append(columns)
+                if len(columns) > width:
+                    width = len(columns)
                 continue
 
             if current_rows:
-                tables.append(ExtractedTable(page=page_index, index=next_table_index, rows=_pad_rows(current_rows)))
+                tables.append(ExtractedTable(page=page_index, index=next_table_index, rows=_pad_rows(current_rows, width)))
                 next_table_index += 1
                 current_rows = []
+                width = 0
 
         if current_rows:
-            tables.append(ExtractedTable(page=page_index, index=next_table_index, rows=_pad_rows(current_rows)))
+            tables.append(ExtractedTable(page=page_index, index=next_table_index, rows=_pad_rows(current_rows, width)))
 
     return tables
 
@@ -100,18 +129,21 @@ def _normalize_table(table: list[list[str | None]] | None) -> list[list[str]]:
         return []
 
     cleaned_rows: list[list[str]] = []
+    width = 0
     for row in table:
         if row is None:
             continue
         normalized_row = ["" if cell is None else str(cell).replace("\n", " ").strip() for cell in row]
         if any(normalized_row):
             cleaned_rows.append(normalized_row)
+            if len(normalized_row) > width:
+                width = len(normalized_row)
 
-    if not cleaned_rows:
-        return []
-    return _pad_rows(cleaned_rows)
+    return _pad_rows(cleaned_rows, width)
 
 
-def _pad_rows(rows: list[list[str]]) -> list[list[str]]:
-    width = max(len(row) for row in rows)
-    return [row + [""] * (width - len(row)) for row in rows]
+def _pad_rows(rows: list[list[str]], width: int) -> list[list[str]]:
+    for row in rows:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+    return rows
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import math
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 
+try:
+    from rapidfuzz import fuzz, process  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency at runtime
+    fuzz = None
+    process = None
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9 ]")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def _normalize(s: str) -> str:
-    return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9 ]", "", s.lower())).strip()
+    return _WS_RE.sub(" ", _NON_ALNUM_RE.sub("", s.lower())).strip()
 
 
 class SemanticMapper:
@@ -13,6 +25,11 @@ class SemanticMapper:
         self.mapping_dictionary = mapping_dictionary
         self.fuzzy_threshold = fuzzy_threshold
         self.normalized_dictionary = {_normalize(k): v for k, v in mapping_dictionary.items()}
+        self._norm_keys = [_normalize(k) for k in mapping_dictionary]
+        self._norm_values = list(mapping_dictionary.values())
+        self._indices_by_length: dict[int, list[int]] = {}
+        for index, norm_key in enumerate(self._norm_keys):
+            self._indices_by_length.setdefault(len(norm_key), []).append(index)
 
     def resolve(self, label: str) -> dict[str, object]:
         if label in self.mapping_dictionary:
@@ -26,19 +43,51 @@ class SemanticMapper:
                 "confidence": 0.95,
             }
 
-        best_key = ""
-        best_score = 0.0
-        for dict_label in self.mapping_dictionary:
-            score = SequenceMatcher(None, normalized, _normalize(dict_label)).ratio()
-            if score > best_score:
-                best_score = score
-                best_key = dict_label
-
-        if best_score >= self.fuzzy_threshold:
+        best_index, best_score = self._best_fuzzy_match(normalized)
+        if best_index is not None and best_score >= self.fuzzy_threshold:
             return {
-                "mapped_to": self.mapping_dictionary[best_key],
+                "mapped_to": self._norm_values[best_index],
                 "method": "fuzzy",
                 "confidence": round(best_score, 2),
             }
 
         return {"mapped_to": None, "method": "unmapped", "confidence": 0.0}
+
+    def _best_fuzzy_match(self, normalized: str) -> tuple[int | None, float]:
+        if process is not None:
+            # Indel ratio >= SequenceMatcher ratio, so RapidFuzz's cutoff is an exact prefilter; the survivors
+            # are re-scored with SequenceMatcher so results do not depend on whether the extra is installed.
+            # The epsilon keeps float rounding in the cutoff from dropping a key that scores exactly at it.
+            matches = process.extract(
+                normalized,
+                self._norm_keys,
+                scorer=fuzz.ratio,
+                score_cutoff=max(0.0, self.fuzzy_threshold * 100 - 1e-6),
+                limit=None,
+            )
+            candidates = sorted(match[2] for match in matches)
+        else:
+            candidates = self._length_candidates(len(normalized))
+
+        best_index: int | None = None
+        best_score = 0.0
+        for index in candidates:
+            score = SequenceMatcher(None, normalized, self._norm_keys[index]).ratio()
+            if score > best_score:
+                best_score = score
+                best_index = index
+        return best_index, best_score
+
+    def _length_candidates(self, length: int) -> list[int]:
+        # ratio = 2*M / (len(a) + len(b)) with M <= min(len(a), len(b)), so only keys
+        # with length in [length*t/(2-t), length*(2-t)/t] can reach threshold t.
+        threshold = self.fuzzy_threshold
+        if threshold <= 0:
+            return list(range(len(self._norm_keys)))
+        low = math.floor(length * threshold / (2 - threshold))
+        high = math.ceil(length * (2 - threshold) / threshold)
+        return sorted(
+            index
+            for key_length in range(low, high + 1)
+            for index in self._indices_by_length.get(key_length, ())
+        )
@@ -1,8 +1,9 @@
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageClassification:
     page: int
     section: str
@@ -10,16 +11,24 @@ class PageClassification:
     signals: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtractionBlock:
     page: int
     text: str
-    bbox: list[float]
+    bbox: Sequence[float]
     source: str
     confidence: float
 
 
-@dataclass(frozen=True)
+class ExtractionBlockTuple(NamedTuple):
+    page: int
+    text: str
+    bbox: tuple[float, ...]
+    source: str
+    confidence: float
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationFinding:
     validation_status: str
     rule: str
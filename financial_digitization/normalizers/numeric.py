@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsedAmount:
     raw: str
     value: float | None
@@ -13,6 +13,8 @@ class ParsedAmount:
 
 
 FOOTNOTE_RE = re.compile(r"[*#]+$")
+YEAR_RANGE_RE = re.compile(r"(20\d{2})\s*[-/]\s*(\d{2,4})")
+MARCH_YEAR_END_RE = re.compile(r"31\s*march\s*(20\d{2})")
 
 
 def parse_amount(raw: str) -> ParsedAmount:
@@ -21,7 +23,7 @@ def parse_amount(raw: str) -> ParsedAmount:
         return ParsedAmount(raw=raw, value=None, parse_status="blank", parse_warnings=[])
 
     warnings: list[str] = []
-    cleaned = FOOTNOTE_RE.sub("", text)
+    cleaned = FOOTNOTE_RE.sub("", text) if text[-1] in "*#" else text
     if cleaned != text:
         warnings.append("FOOTNOTE_MARKER_REMOVED")
 
@@ -41,14 +43,14 @@ def parse_amount(raw: str) -> ParsedAmount:
 
 def normalize_period(header: str) -> str | None:
     h = header.strip().lower()
-    match = re.search(r"(20\d{2})\s*[-/]\s*(\d{2,4})", h)
+    match = YEAR_RANGE_RE.search(h)
     if match:
         y1, y2 = match.group(1), match.group(2)
         if len(y2) == 4:
             y2 = y2[-2:]
         return f"FY{y1}-{y2}"
 
-    match = re.search(r"31\s*march\s*(20\d{2})", h)
+    match = MARCH_YEAR_END_RE.search(h)
     if match:
         year = int(match.group(1))
         return f"FY{year-1}-{str(year)[-2:]}"
@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
 from financial_digitization.models.contracts import PageClassification
 
+try:
+    import ahocorasick  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency at runtime
+    ahocorasick = None
+
+if TYPE_CHECKING:
+    import ahocorasick  # type: ignore  # noqa: F811
+
 SECTION_RULES: dict[str, list[str]] = {
     "BALANCE_SHEET": ["balance sheet", "equity and liabilities", "assets"],
     "BALANCE_SHEET_SCHEDULE": ["schedule", "notes to balance sheet"],
@@ -11,15 +23,36 @@ SECTION_RULES: dict[str, list[str]] = {
     "AUDIT_REPORT": ["independent auditor", "true and fair", "qualified opinion"],
 }
 
+_ALL_KEYWORDS: tuple[str, ...] = tuple(dict.fromkeys(kw for keywords in SECTION_RULES.values() for kw in keywords))
+
+
+def _build_keyword_automaton() -> ahocorasick.Automaton | None:
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in _ALL_KEYWORDS:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON: ahocorasick.Automaton | None = _build_keyword_automaton()
+
+
+def _find_keywords(t: str) -> set[str]:
+    if _KEYWORD_AUTOMATON is None:
+        return {kw for kw in _ALL_KEYWORDS if kw in t}
+    return {kw for _, kw in _KEYWORD_AUTOMATON.iter(t)}
+
 
 
 def classify_page_text(page: int, text: str) -> PageClassification:
-    t = text.lower()
+    found = _find_keywords(text.lower())
     scores: dict[str, int] = {}
     hits: dict[str, list[str]] = {}
 
     for section, keywords in SECTION_RULES.items():
-        matched = [kw for kw in keywords if kw in t]
+        matched = [kw for kw in keywords if kw in found]
         if matched:
             scores[section] = len(matched)
             hits[section] = matched
@@ -34,15 +67,15 @@ def classify_page_text(page: int, text: str) -> PageClassification:
 
 
 
-def classify_document(page_texts: list[str], threshold: float = 0.75) -> dict[str, object]:
-    page_map = [classify_page_text(i + 1, text) for i, text in enumerate(page_texts)]
-    requires_review = any(item.confidence < threshold for item in page_map)
+def classify_document(page_texts: Iterable[str], threshold: float = 0.75) -> dict[str, object]:
+    page_map = [classify_page_text(page, text) for page, text in enumerate(page_texts, start=1)]
+    review_reasons = [
+        f"LOW_CLASSIFICATION_CONFIDENCE_PAGE_{item.page}"
+        for item in page_map
+        if item.confidence < threshold
+    ]
     return {
-        "page_map": [item.__dict__ for item in page_map],
-        "requires_manual_review": requires_review,
-        "review_reasons": [
-            f"LOW_CLASSIFICATION_CONFIDENCE_PAGE_{item.page}"
-            for item in page_map
-            if item.confidence < threshold
-        ],
+        "page_map": [asdict(item) for item in page_map],
+        "requires_manual_review": bool(review_reasons),
+        "review_reasons": review_reasons,
     }
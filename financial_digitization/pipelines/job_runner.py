@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime, timezone
+from importlib import metadata
+from itertools import repeat
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
 from financial_digitization.mappers.semantic_mapper import SemanticMapper
@@ -11,55 +18,128 @@ from financial_digitization.normalizers.numeric import parse_amount
 from financial_digitization.pipelines.classifier import classify_document
 from financial_digitization.validators.financial_rules import FinancialValidator, summarize_findings
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency at runtime
+    orjson = None
+
+
+_SCHEMA_VERSION = "1.0.0"
+# Bump whenever classification, validation or the envelope layout changes, so cached envelopes are rebuilt.
+_PIPELINE_VERSION = "1"
+try:
+    _PACKAGE_VERSION = metadata.version("financial-digitization")
+except metadata.PackageNotFoundError:  # pragma: no cover - running from a source checkout
+    _PACKAGE_VERSION = "0+unknown"
+
+
+def _dumps(obj: object, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _demo_validation() -> dict[str, object]:
+    validator = FinancialValidator(tolerance_absolute=1)
+    return summarize_findings(
+        [
+            validator.check_balance_sheet(100_000, 100_000),
+            validator.check_cash_flow(5000, -500, 4500),
+            validator.check_income_expenditure(12000, 1000, 11000, 2000),
+        ]
+    )
+
+
+# The skeleton pipeline evidences each stage with fixed demo inputs; evaluate them once at import.
+# Envelopes get deep copies so callers mutating one envelope cannot leak into later jobs.
+_DEMO_PARSED_AMOUNT = asdict(parse_amount("1,23,45,000"))
+_DEMO_MAPPING = SemanticMapper(
+    {"Plant & Machinery": "balance_sheet.assets.non_current_assets.plant_machinery"}
+).resolve("Plant and Machinery")
+_DEMO_VALIDATION = _demo_validation()
+
 
 class ETLJobRunner:
-    def __init__(self, output_root: Path) -> None:
+    def __init__(self, output_root: Path, use_cache: bool = True) -> None:
         self.output_root = output_root
         self.output_root.mkdir(parents=True, exist_ok=True)
+        self.use_cache = use_cache
+        self.cache_dir = self.output_root / ".envelope_cache"
 
-    def _hash_file(self, file_path: Path) -> str:
-        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    def _stat_and_hash(self, file_path: Path) -> tuple[int, str]:
+        sha256 = hashlib.sha256()
+        with file_path.open("rb") as handle:
+            size_bytes = os.fstat(handle.fileno()).st_size
+            while chunk := handle.read(65536):
+                sha256.update(chunk)
+        return size_bytes, sha256.hexdigest()
 
     def _job_dir(self, job_id: str) -> Path:
         path = self.output_root / job_id
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    def _cache_path(self, source_files: list[dict[str, object]], page_texts: list[str]) -> Path:
+        key = hashlib.sha256(f"{_SCHEMA_VERSION}\0{_PIPELINE_VERSION}\0{_PACKAGE_VERSION}\0".encode("utf-8"))
+        for source in source_files:
+            key.update(f"{source['filename']}\0{source['sha256']}\0".encode("utf-8"))
+        for text in page_texts:
+            key.update(text.encode("utf-8") + b"\0")
+        return self.cache_dir / f"{key.hexdigest()}.json"
+
+    def _load_cached(self, cache_path: Path) -> dict[str, object] | None:
+        try:
+            job_id = _loads(cache_path.read_bytes())["job_id"]
+            return _loads((self.output_root / job_id / "mapped_canonical.json").read_bytes())
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
     def run(self, file_paths: list[Path], page_texts: list[str]) -> dict[str, object]:
+        if len(file_paths) > 1:
+            # hashlib releases the GIL while digesting, so threads overlap hashing with file reads.
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                digests = list(executor.map(self._stat_and_hash, file_paths))
+        else:
+            digests = [self._stat_and_hash(p) for p in file_paths]
+
+        source_files: list[dict[str, object]] = [
+            {"filename": p.name, "size_bytes": size_bytes, "sha256": sha256, "page_count": len(page_texts)}
+            for p, (size_bytes, sha256) in zip(file_paths, digests)
+        ]
+
+        cache_path = self._cache_path(source_files, page_texts) if self.use_cache else None
+        if cache_path is not None:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return cached
+
         job_id = str(uuid4())
         job_dir = self._job_dir(job_id)
-
-        source_files = [
-            {
-                "filename": p.name,
-                "size_bytes": p.stat().st_size,
-                "sha256": self._hash_file(p),
-                "page_count": len(page_texts),
-            }
-            for p in file_paths
-        ]
+        now_iso = datetime.now(timezone.utc).isoformat()
 
         classification = classify_document(page_texts)
 
-        parsed_demo_amount = parse_amount("1,23,45,000")
-        mapper = SemanticMapper({"Plant & Machinery": "balance_sheet.assets.non_current_assets.plant_machinery"})
-        mapping_demo = mapper.resolve("Plant and Machinery")
-
-        validator = FinancialValidator(tolerance_absolute=1)
-        findings = [
-            validator.check_balance_sheet(100_000, 100_000),
-            validator.check_cash_flow(5000, -500, 4500),
-            validator.check_income_expenditure(12000, 1000, 11000, 2000),
-        ]
-        validation = summarize_findings(findings)
+        validation, demo_parsed_amount, demo_mapping = copy.deepcopy(
+            (_DEMO_VALIDATION, _DEMO_PARSED_AMOUNT, _DEMO_MAPPING)
+        )
+        classification_review = classification["requires_manual_review"]
+        classification_reasons = classification["review_reasons"]
+        validation_review = validation["requires_manual_review"]
+        validation_reasons = validation["review_reasons"]
 
         envelope = {
-            "schema_version": "1.0.0",
+            "schema_version": _SCHEMA_VERSION,
             "job": {
                 "job_id": job_id,
                 "source_files": source_files,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "processed_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": now_iso,
+                "processed_at": now_iso,
             },
             "entity": {"ulb_name": "", "ulb_code": "", "state": ""},
             "statement_periods": ["FY2023-24", "FY2022-23"],
@@ -72,27 +152,36 @@ class ETLJobRunner:
             },
             "confidence": {"overall": 0.8, "by_statement": {}},
             "validation": validation,
-            "requires_manual_review": classification["requires_manual_review"] or validation["requires_manual_review"],
-            "review_reasons": classification["review_reasons"] + validation["review_reasons"],
+            "requires_manual_review": classification_review or validation_review,
+            "review_reasons": [*classification_reasons, *validation_reasons],
             "evidence_index": {
-                "demo_parsed_amount": parsed_demo_amount.__dict__,
-                "demo_mapping": mapping_demo,
+                "demo_parsed_amount": demo_parsed_amount,
+                "demo_mapping": demo_mapping,
                 "page_map": classification["page_map"],
             },
         }
 
-        (job_dir / "mapped_canonical.json").write_text(json.dumps(envelope, indent=2), encoding="utf-8")
-        (job_dir / "validation_report.json").write_text(json.dumps(validation, indent=2), encoding="utf-8")
-        (job_dir / "job_log.jsonl").write_text(
-            json.dumps({"event": "job_completed", "job_id": job_id, "timestamp": datetime.now(timezone.utc).isoformat()}) + "\n",
-            encoding="utf-8",
-        )
+        (job_dir / "mapped_canonical.json").write_bytes(_dumps(envelope, indent=True))
+        (job_dir / "validation_report.json").write_bytes(_dumps(validation, indent=True))
+        with (job_dir / "job_log.jsonl").open("ab") as job_log:
+            job_log.write(_dumps({"event": "job_completed", "job_id": job_id, "timestamp": now_iso}) + b"\n")
+        if cache_path is not None:
+            self.cache_dir.mkdir(exist_ok=True)
+            cache_path.write_bytes(_dumps({"job_id": job_id}))
         return envelope
+
+
+def _run_one(pdf: Path, output_root: Path, use_cache: bool = True) -> str:
+    envelope = ETLJobRunner(output_root=output_root, use_cache=use_cache).run(file_paths=[pdf], page_texts=[""])
+    return str(envelope["job"]["job_id"])
+
+
 def _collect_pdfs(input_path: Path) -> list[Path]:
     if input_path.is_file() and input_path.suffix.lower() == ".pdf":
         return [input_path]
     if input_path.is_dir():
-        return sorted(input_path.glob("*.pdf"))
+        with os.scandir(input_path) as entries:
+            return sorted(Path(entry.path) for entry in entries if entry.name.lower().endswith(".pdf") and entry.is_file())
     return []
 
 
@@ -102,6 +191,17 @@ def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Financial digitization ETL (skeleton runner).")
     parser.add_argument("--input", required=True, help="PDF file or folder containing PDFs")
     parser.add_argument("--out", required=True, help="Output root folder for job artifacts")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of PDFs to process in parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Reprocess PDFs even if an identical input was already digitized under --out",
+    )
     args = parser.parse_args(argv)
 
     input_path = Path(args.input)
@@ -111,12 +211,16 @@ def main(argv: list[str] | None = None) -> int:
     if not pdfs:
         raise SystemExit(f"No PDFs found at: {input_path}")
 
-    runner = ETLJobRunner(output_root=output_root)
+    workers = max(1, min(args.workers, len(pdfs)))
 
-    for pdf in pdfs:
-        envelope = runner.run(file_paths=[pdf], page_texts=[""])
-        job_id = envelope["job"]["job_id"]
-        print(f"OK: {pdf.name} -> {output_root / job_id}")
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        mapper = executor.map if executor is not None else map
+        for pdf, job_id in zip(pdfs, mapper(_run_one, pdfs, repeat(output_root), repeat(not args.no_cache))):
+            print(f"OK: {pdf.name} -> {output_root / job_id}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     return 0
 
@@ -0,0 +1,19 @@
+from dataclasses import astuple, fields
+
+from financial_digitization.extractors.adapters import OCRExtractor, PDFTextExtractor
+from financial_digitization.models.contracts import ExtractionBlock, ExtractionBlockTuple
+
+
+def test_extraction_block_tuple_fields_match_dataclass() -> None:
+    assert ExtractionBlockTuple._fields == tuple(field.name for field in fields(ExtractionBlock))
+
+
+def test_extract_raw_matches_extract() -> None:
+    texts = ["Balance Sheet", "", "Cash Flow Statement"]
+    for extractor, source, confidence in ((PDFTextExtractor(), "pdf_text", 0.99), (OCRExtractor(), "ocr", 0.85)):
+        raw = extractor.extract_raw(texts)
+        blocks = extractor.extract(texts)
+
+        assert raw[0] == ExtractionBlockTuple(1, "Balance Sheet", (0.0, 0.0, 1.0, 1.0), source, confidence)
+        assert [block.page for block in raw] == [1, 2, 3]
+        assert [tuple(block) for block in raw] == [astuple(block) for block in blocks]
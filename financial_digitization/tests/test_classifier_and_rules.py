@@ -1,4 +1,7 @@
+from decimal import Decimal
+
 from financial_digitization.pipelines.classifier import classify_document
+from financial_digitization.validators import financial_rules
 from financial_digitization.validators.financial_rules import FinancialValidator, summarize_findings
 
 
@@ -17,3 +20,35 @@ def test_validation_summary_fails_when_rule_fails() -> None:
     summary = summarize_findings(findings)
     assert summary["validation_status"] == "FAILED"
     assert summary["requires_manual_review"] is True
+
+
+def test_crossfoot_batch_reports_only_failed_rows() -> None:
+    validator = FinancialValidator(tolerance_absolute=1)
+    findings = validator.check_crossfoot_batch([100, 250, 75], [100.5, 240, 75])
+    assert [f.rule for f in findings] == ["CROSSFOOT_ROW_2"]
+    assert findings[0].validation_status == "FAILED"
+    assert findings[0].variance == -10
+    assert summarize_findings(findings)["review_reasons"] == ["CROSSFOOT_ROW_2"]
+
+
+def test_crossfoot_batch_matches_scalar_check_with_and_without_numpy() -> None:
+    validator = FinancialValidator(tolerance_absolute=1.0)
+    parents = [10**17, 10**17, 10**17, Decimal("0.1"), 100, float("nan")]
+    children = [10**17 + 2, 10**17 + 1, 10**17 - 3, Decimal("1.2"), 101, 5.0]
+    expected = [
+        f"CROSSFOOT_ROW_{row + 1}"
+        for row, (parent, child) in enumerate(zip(parents, children))
+        if validator.check_crossfoot(parent, child).validation_status == "FAILED"
+    ]
+    assert expected == ["CROSSFOOT_ROW_1", "CROSSFOOT_ROW_3", "CROSSFOOT_ROW_4", "CROSSFOOT_ROW_6"]
+
+    numpy_module = financial_rules.np
+    try:
+        financial_rules.np = None
+        without_numpy = [f.rule for f in validator.check_crossfoot_batch(parents, children)]
+    finally:
+        financial_rules.np = numpy_module
+    with_numpy = [f.rule for f in validator.check_crossfoot_batch(parents, children)]
+
+    assert without_numpy == expected
+    assert with_numpy == expected
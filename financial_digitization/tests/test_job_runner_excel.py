@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from zipfile import ZipFile
 
+from financial_digitization.pipelines import job_runner
 from financial_digitization.pipelines.job_runner import ETLJobRunner
 
 
@@ -24,3 +25,49 @@ def test_job_runner_creates_excel_per_pdf(tmp_path: Path) -> None:
         assert "[Content_Types].xml" in names
         assert "xl/workbook.xml" in names
         assert "xl/worksheets/sheet1.xml" in names
+
+
+def test_job_runner_reuses_cached_envelope_for_identical_input(tmp_path: Path) -> None:
+    pdf = tmp_path / "balance_sheet.pdf"
+    pdf.write_bytes(b"pdf-one")
+
+    runner = ETLJobRunner(output_root=tmp_path / "out")
+    first = runner.run([pdf], ["Balance Sheet assets"])
+    second = runner.run([pdf], ["Balance Sheet assets"])
+    assert second["job"]["job_id"] == first["job"]["job_id"]
+
+    changed = runner.run([pdf], ["Cash flow"])
+    assert changed["job"]["job_id"] != first["job"]["job_id"]
+
+    uncached = ETLJobRunner(output_root=tmp_path / "out", use_cache=False).run([pdf], ["Balance Sheet assets"])
+    assert uncached["job"]["job_id"] != first["job"]["job_id"]
+
+
+def test_job_runner_cache_is_invalidated_by_pipeline_version(tmp_path: Path) -> None:
+    pdf = tmp_path / "balance_sheet.pdf"
+    pdf.write_bytes(b"pdf-one")
+
+    runner = ETLJobRunner(output_root=tmp_path / "out")
+    first = runner.run([pdf], ["Balance Sheet assets"])
+
+    original = job_runner._PIPELINE_VERSION
+    job_runner._PIPELINE_VERSION = original + "-next"
+    try:
+        upgraded = runner.run([pdf], ["Balance Sheet assets"])
+    finally:
+        job_runner._PIPELINE_VERSION = original
+    assert upgraded["job"]["job_id"] != first["job"]["job_id"]
+
+
+def test_job_runner_envelopes_do_not_share_demo_evidence(tmp_path: Path) -> None:
+    pdf = tmp_path / "balance_sheet.pdf"
+    pdf.write_bytes(b"pdf-one")
+
+    runner = ETLJobRunner(output_root=tmp_path / "out", use_cache=False)
+    first = runner.run([pdf], ["Balance Sheet assets"])
+    first["validation"]["review_reasons"].append("edited by caller")
+    first["evidence_index"]["demo_mapping"]["mapped_to"] = "edited"
+
+    second = runner.run([pdf], ["Balance Sheet assets"])
+    assert "edited by caller" not in second["validation"]["review_reasons"]
+    assert second["evidence_index"]["demo_mapping"]["mapped_to"] != "edited"
@@ -1,7 +1,53 @@
 from __future__ import annotations
 
-from financial_digitization.extractors.pdf_tables import ExtractedTable, extract_tables_from_text
-from web_digitizer import DigitizationHandler
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from financial_digitization.extractors import pdf_tables
+from financial_digitization.extractors.pdf_tables import ExtractedTable, extract_page_texts, extract_tables_from_text
+from web_digitizer import DigitizationHandler, DigitizationServer
+
+
+def _write_text_pdf(path: Path, page_texts: list[str]) -> None:
+    page_count = len(page_texts)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(page_count))
+        + b"] /Count %d >>" % page_count,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (" + text.encode("ascii") + b") Tj ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+def test_extract_page_texts_parallel_keeps_page_order(tmp_path: Path) -> None:
+    expected = [f"Page {number}" for number in range(1, 41)]
+    pdf_path = tmp_path / "long.pdf"
+    _write_text_pdf(pdf_path, expected)
+
+    page_texts = extract_page_texts(pdf_path, max_workers=3)
+    if pdf_tables.PdfReader is None:
+        assert page_texts == []
+        return
+    assert page_texts == expected
+    assert extract_page_texts(pdf_path) == expected
 
 
 def test_extract_tables_from_text_detects_multiple_tables() -> None:
@@ -45,3 +91,29 @@ def test_split_particulars_and_amounts_detaches_embedded_current_year_amount() -
     assert particulars == "Less: Schedule I1(A)"
     assert current_year == "4,366,215,311.00-"
     assert previous_year == "3,574,623,087.00-"
+
+
+class _BrokenExecutor:
+    def submit(self, *args: object) -> None:
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        pass
+
+
+def test_digitization_server_replaces_broken_worker_pool() -> None:
+    server = DigitizationServer(("127.0.0.1", 0), DigitizationHandler, workers=2)
+    try:
+        broken = _BrokenExecutor()
+        server.digitize_executor = broken
+        try:
+            server.digitize(Path("upload.pdf"), Path("out"), Path("upload.xlsx"))
+        except BrokenProcessPool:
+            pass
+        else:
+            raise AssertionError("expected BrokenProcessPool")
+        assert server.digitize_executor is not None
+        assert server.digitize_executor is not broken
+    finally:
+        server.server_close()
+    assert server.digitize_executor is None
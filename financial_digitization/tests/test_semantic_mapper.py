@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+from financial_digitization.mappers import semantic_mapper
+from financial_digitization.mappers.semantic_mapper import SemanticMapper
+
+
+def _indel_ratio(a: str, b: str) -> float:
+    # Same score as rapidfuzz.fuzz.ratio: 100 * 2 * LCS / (len(a) + len(b)).
+    if not a and not b:
+        return 100.0
+    previous = [0] * (len(b) + 1)
+    for char in a:
+        current = [0]
+        for j, other in enumerate(b, start=1):
+            current.append(previous[j - 1] + 1 if char == other else max(previous[j], current[j - 1]))
+        previous = current
+    return 200.0 * previous[-1] / (len(a) + len(b))
+
+
+def _extract(query, choices, scorer, score_cutoff, limit):
+    scored = ((choice, _indel_ratio(query, choice), index) for index, choice in enumerate(choices))
+    return [match for match in scored if match[1] >= score_cutoff]
+
+
+def test_semantic_mapper_resolution_methods() -> None:
+    mapper = SemanticMapper({"Plant & Machinery": "bs.plant_machinery", "Cash and Bank": "bs.cash"})
+    assert mapper.resolve("Plant & Machinery")["method"] == "dictionary"
+    assert mapper.resolve("plant  machinery")["method"] == "normalized"
+
+    fuzzy = mapper.resolve("Cash and Banks")
+    assert fuzzy["method"] == "fuzzy"
+    assert fuzzy["mapped_to"] == "bs.cash"
+    assert 0.86 <= fuzzy["confidence"] < 1.0
+
+    assert mapper.resolve("Sundry Creditors")["method"] == "unmapped"
+
+
+def test_semantic_mapper_fuzzy_match_does_not_depend_on_rapidfuzz() -> None:
+    mapper = SemanticMapper(
+        {
+            "Sundry Creditors": "bs.creditors",
+            "Creditors for Expenses": "bs.creditors_expenses",
+            "Cash and Bank": "bs.cash",
+            "Cash at Bank": "bs.cash_at_bank",
+            "Free Reserves": "bs.free_reserves",
+            "Fixed Deposits": "bs.fixed_deposits",
+        }
+    )
+    labels = [
+        "creditorsfreeres",
+        "Sundry Creditor",
+        "Cash an Bank",
+        "Cash at Bnk",
+        "Free Reserve",
+        "Fixd Deposits",
+        "Creditors for Expense",
+        "Totally unrelated",
+    ]
+    fallback = semantic_mapper.process, semantic_mapper.fuzz
+    try:
+        semantic_mapper.process, semantic_mapper.fuzz = None, None
+        without_rapidfuzz = [mapper.resolve(label) for label in labels]
+        if fallback[0] is None:
+            semantic_mapper.process = SimpleNamespace(extract=_extract)
+            semantic_mapper.fuzz = SimpleNamespace(ratio=_indel_ratio)
+        else:
+            semantic_mapper.process, semantic_mapper.fuzz = fallback
+        with_rapidfuzz = [mapper.resolve(label) for label in labels]
+    finally:
+        semantic_mapper.process, semantic_mapper.fuzz = fallback
+    assert with_rapidfuzz == without_rapidfuzz
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import asdict
+
 from financial_digitization.models.contracts import ValidationFinding
 
+try:
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency at runtime
+    np = None
+
 
 class FinancialValidator:
     def __init__(self, tolerance_absolute: float = 1.0) -> None:
@@ -33,12 +41,50 @@ class FinancialValidator:
     def check_crossfoot(self, parent_total: float, child_sum: float, rule: str = "CROSSFOOT") -> ValidationFinding:
         return self._make_finding(rule, parent_total, child_sum, severity="MEDIUM")
 
+    def check_crossfoot_batch(
+        self,
+        parent_totals: Sequence[float],
+        child_sums: Sequence[float],
+        rule: str = "CROSSFOOT",
+    ) -> list[ValidationFinding]:
+        """Crossfoot many rows at once, returning findings only for the rows that fail."""
+        if len(parent_totals) != len(child_sums):
+            raise ValueError("parent_totals and child_sums must have the same length")
+
+        if np is not None:
+            try:
+                parents = np.asarray(parent_totals, dtype=float)
+                children = np.asarray(child_sums, dtype=float)
+            except OverflowError:
+                candidate_rows = range(len(parent_totals))
+            else:
+                # float64 can round large ints and Decimals, so only use NumPy as a prefilter: widen by a
+                # rounding margin here and confirm each candidate in the caller's own numeric type below.
+                tolerance = float(self.tolerance_absolute)
+                margin = 4 * np.finfo(float).eps * (np.abs(parents) + np.abs(children) + abs(tolerance))
+                within = np.abs(children - parents) <= tolerance - margin
+                candidate_rows = np.flatnonzero(~within).tolist()
+        else:
+            candidate_rows = [
+                row
+                for row, (expected, actual) in enumerate(zip(parent_totals, child_sums))
+                if not abs(actual - expected) <= self.tolerance_absolute
+            ]
+
+        findings = []
+        for row in candidate_rows:
+            expected, actual = parent_totals[row], child_sums[row]
+            finding = self._make_finding(f"{rule}_ROW_{row + 1}", expected, actual, severity="MEDIUM")
+            if finding.validation_status == "FAILED":
+                findings.append(finding)
+        return findings
+
 
 def summarize_findings(findings: list[ValidationFinding]) -> dict[str, object]:
     failures = [f for f in findings if f.validation_status == "FAILED"]
     return {
         "validation_status": "FAILED" if failures else "PASSED",
-        "findings": [f.__dict__ for f in findings],
+        "findings": [asdict(f) for f in findings],
         "requires_manual_review": bool(failures),
         "review_reasons": [f.rule for f in failures],
     }
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 try:
@@ -9,73 +13,148 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     Draft202012Validator = None
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency at runtime
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def _compile_schema(schema_path: Path) -> tuple[dict[str, Any], Any, _FallbackCheck | None]:
+    data = schema_path.read_bytes()
+    schema = orjson.loads(data) if orjson is not None else json.loads(data)
+    if Draft202012Validator is None:
+        return schema, None, _compile_fallback(schema)
+    Draft202012Validator.check_schema(schema)
+    return schema, Draft202012Validator(schema), None
+
+
+_DEFAULT_SCHEMA_DIR = Path(__file__).resolve().parents[1] / "schemas" / "1.0.0"
+
 
 class SchemaValidator:
     def __init__(self, schema_dir: Path | None = None) -> None:
-        self.schema_dir = schema_dir or Path(__file__).resolve().parents[1] / "schemas" / "1.0.0"
+        self.schema_dir = schema_dir or _DEFAULT_SCHEMA_DIR
+
+    def _compiled(self, schema_name: str) -> tuple[dict[str, Any], Any, _FallbackCheck | None]:
+        if self.schema_dir == _DEFAULT_SCHEMA_DIR and schema_name in _SCHEMA_REGISTRY:
+            return _SCHEMA_REGISTRY[schema_name]
+        return _compile_schema(self.schema_dir / schema_name)
 
     def _load_schema(self, schema_name: str) -> dict[str, Any]:
-        schema_path = self.schema_dir / schema_name
-        return json.loads(schema_path.read_text(encoding="utf-8"))
+        return self._compiled(schema_name)[0]
 
     def validate(self, payload: dict[str, Any], schema_name: str) -> list[str]:
-        schema = self._load_schema(schema_name)
-        if Draft202012Validator is not None:
-            validator = Draft202012Validator(schema)
-            errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-            return [f"{'/'.join(map(str, err.path))}: {err.message}" for err in errors]
-        return _fallback_validate(payload, schema)
+        _, validator, fallback_check = self._compiled(schema_name)
+        if validator is not None:
+            errors = []
+            for err in validator.iter_errors(payload):
+                path = tuple(err.path)
+                errors.append((path, f"{'/'.join(map(str, path))}: {err.message}"))
+            errors.sort(key=itemgetter(0))
+            return [message for _, message in errors]
+        return _fallback_validate(payload, fallback_check)
+
 
+_FallbackCheck = Callable[[Any, str, list[str], list[tuple["_FallbackCheck", Any, str]]], None]
 
-def _fallback_validate(payload: Any, schema: dict[str, Any], path: str = "") -> list[str]:
+_SCALAR_TYPE_CHECKS: dict[str, tuple[type | tuple[type, ...], str]] = {
+    "string": (str, "Expected string"),
+    "integer": (int, "Expected integer"),
+    "number": ((int, float), "Expected number"),
+    "boolean": (bool, "Expected boolean"),
+}
+
+
+def _fallback_validate(payload: Any, check: _FallbackCheck, path: str = "") -> list[str]:
     errors: list[str] = []
+    stack: list[tuple[_FallbackCheck, Any, str]] = [(check, payload, path)]
+    while stack:
+        check, value, value_path = stack.pop()
+        check(value, value_path, errors, stack)
+    return errors
+
+
+def _compile_fallback(schema: dict[str, Any]) -> _FallbackCheck:
+    """Specialize one schema node into a check that pushes child checks onto the work stack."""
     expected_type = schema.get("type")
+    const = schema.get("const")
+    enum = schema.get("enum")
+
+    def check_value(value: Any, path: str, errors: list[str]) -> None:
+        if const is not None and value != const:
+            errors.append(f"{path}: Value must be {const}")
+        if enum is not None and value not in enum:
+            errors.append(f"{path}: Value must be one of {enum}")
+
+    def check_value_after_children(value: Any, path: str, errors: list[str], stack: list) -> None:
+        check_value(value, path, errors)
+
+    has_value_checks = const is not None or enum is not None
+
     if expected_type == "object":
-        if not isinstance(payload, dict):
-            return [f"{path}: Expected object"]
-        required = schema.get("required", [])
-        for key in required:
-            if key not in payload:
-                errors.append(f"{path}: '{key}' is a required property")
-
-        props = schema.get("properties", {})
-        if schema.get("additionalProperties") is False:
-            for key in payload:
-                if key not in props:
-                    errors.append(f"{path}: Additional properties are not allowed ('{key}' was unexpected)")
-
-        for key, value in payload.items():
-            child_path = f"{path}/{key}" if path else key
-            if key in props:
-                errors.extend(_fallback_validate(value, props[key], child_path))
-            elif isinstance(schema.get("additionalProperties"), dict):
-                errors.extend(_fallback_validate(value, schema["additionalProperties"], child_path))
-
-    elif expected_type == "array":
-        if not isinstance(payload, list):
-            return [f"{path}: Expected array"]
+        required = tuple(schema.get("required", []))
+        required_set = frozenset(required)
+        props = {key: _compile_fallback(child) for key, child in schema.get("properties", {}).items()}
+        prop_keys = frozenset(props)
+        additional = schema.get("additionalProperties")
+        closed = additional is False
+        additional_check = _compile_fallback(additional) if isinstance(additional, dict) else None
+
+        def check_object(value: Any, path: str, errors: list[str], stack: list) -> None:
+            if not isinstance(value, dict):
+                errors.append(f"{path}: Expected object")
+                return
+            # Set differences keep the common all-valid case in C; order is restored only when reporting.
+            missing = required_set - value.keys()
+            if missing:
+                errors.extend(f"{path}: '{key}' is a required property" for key in required if key in missing)
+            if closed:
+                extra = value.keys() - prop_keys
+                if extra:
+                    errors.extend(
+                        f"{path}: Additional properties are not allowed ('{key}' was unexpected)"
+                        for key in value
+                        if key in extra
+                    )
+            if has_value_checks:
+                stack.append((check_value_after_children, value, path))
+            children: list[tuple[_FallbackCheck, Any, str]] = []
+            for key, nested in value.items():
+                child_check = props.get(key, additional_check)
+                if child_check is not None:
+                    children.append((child_check, nested, f"{path}/{key}" if path else key))
+            stack.extend(reversed(children))
+
+        return check_object
+
+    if expected_type == "array":
         item_schema = schema.get("items")
-        if item_schema:
-            for idx, item in enumerate(payload):
-                errors.extend(_fallback_validate(item, item_schema, f"{path}[{idx}]"))
-
-    elif expected_type == "string" and not isinstance(payload, str):
-        errors.append(f"{path}: Expected string")
-    elif expected_type == "integer" and not isinstance(payload, int):
-        errors.append(f"{path}: Expected integer")
-    elif expected_type == "number" and not isinstance(payload, (int, float)):
-        errors.append(f"{path}: Expected number")
-    elif expected_type == "boolean" and not isinstance(payload, bool):
-        errors.append(f"{path}: Expected boolean")
+        item_check = _compile_fallback(item_schema) if item_schema else None
 
-    const = schema.get("const")
-    if const is not None and payload != const:
-        errors.append(f"{path}: Value must be {const}")
+        def check_array(value: Any, path: str, errors: list[str], stack: list) -> None:
+            if not isinstance(value, list):
+                errors.append(f"{path}: Expected array")
+                return
+            if has_value_checks:
+                stack.append((check_value_after_children, value, path))
+            if item_check is not None:
+                stack.extend((item_check, value[idx], f"{path}[{idx}]") for idx in range(len(value) - 1, -1, -1))
 
-    enum = schema.get("enum")
-    if enum is not None and payload not in enum:
-        errors.append(f"{path}: Value must be one of {enum}")
+        return check_array
 
-    for key in ("$defs", "$schema", "title", "minProperties", "minimum", "maximum"):
-        _ = schema.get(key)
-    return errors
+    type_check = _SCALAR_TYPE_CHECKS.get(expected_type) if isinstance(expected_type, str) else None
+
+    def check_scalar(value: Any, path: str, errors: list[str], stack: list) -> None:
+        if type_check is not None and not isinstance(value, type_check[0]):
+            errors.append(f"{path}: {type_check[1]}")
+        if has_value_checks:
+            check_value(value, path, errors)
+
+    return check_scalar
+
+
+# Built last: compiling the fallback checks needs the helpers defined above.
+_SCHEMA_REGISTRY = MappingProxyType(
+    {schema_path.name: _compile_schema(schema_path) for schema_path in sorted(_DEFAULT_SCHEMA_DIR.glob("*.json"))}
+)
@@ -1,26 +1,34 @@
-﻿from pathlib import Path
+﻿import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
 from financial_digitization.pipelines.job_runner import ETLJobRunner
 
 INPUT_PATH = Path(r"D:\digitize-data\pdf")
 OUTPUT_ROOT = Path(r"D:\digitize-data\output")
+WORKERS = os.cpu_count() or 1
 
 def collect_pdfs(p: Path) -> list[Path]:
     if p.is_file() and p.suffix.lower() == ".pdf":
         return [p]
     if p.is_dir():
-        return sorted(p.glob("*.pdf"))
+        with os.scandir(p) as entries:
+            return sorted(Path(entry.path) for entry in entries if entry.name.lower().endswith(".pdf") and entry.is_file())
     return []
 
+def _process_one(pdf: Path) -> Path:
+    # Each worker builds its own runner so nothing heavier than the path is pickled.
+    runner = ETLJobRunner(output_root=OUTPUT_ROOT)
+    # NOTE: extraction is not implemented yet in this skeleton; pass placeholder page_texts
+    envelope = runner.run(file_paths=[pdf], page_texts=[""])
+    return OUTPUT_ROOT / envelope["job"]["job_id"]
+
 if __name__ == "__main__":
     pdfs = collect_pdfs(INPUT_PATH)
     if not pdfs:
         raise SystemExit(f"No PDFs found at: {INPUT_PATH}")
 
-    runner = ETLJobRunner(output_root=OUTPUT_ROOT)
-
-    for pdf in pdfs:
-        # NOTE: extraction is not implemented yet in this skeleton; pass placeholder page_texts
-        envelope = runner.run(file_paths=[pdf], page_texts=[""])
-        job_id = envelope["job"]["job_id"]
-        job_dir = OUTPUT_ROOT / job_id
-        print(f"OK: {pdf.name} -> {job_dir}")
+    with ProcessPoolExecutor(max_workers=max(1, min(WORKERS, len(pdfs)))) as executor:
+        futures = {executor.submit(_process_one, pdf): pdf for pdf in pdfs}
+        for future in as_completed(futures):
+            print(f"OK: {futures[future].name} -> {future.result()}")
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import multiprocessing
+import os
 import re
+import signal
 import sys
 import tempfile
+import threading
+import time
 import traceback
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from urllib.parse import unquote, urlparse
+from urllib.parse import unquote
 
 from financial_digitization.exporters.excel_writer import write_excel
 from financial_digitization.extractors.pdf_tables import ExtractedTable, extract_page_texts, extract_tables
@@ -16,8 +26,19 @@ from financial_digitization.pipelines.job_runner import ETLJobRunner
 
 _AMOUNT_TOKEN_RE = re.compile(r"(?<![A-Za-z0-9])[\(\-]?\d[\d,]*(?:\.\d+)?-?\)?(?![A-Za-z0-9])")
 _YEAR_HEADER_RE = re.compile(r"(?:19|20)\d{2}(?:\s*-\s*(?:19|20)?\d{2})?|FY\s*\d{2,4}", re.IGNORECASE)
+_DIGIT_RE = re.compile(r"\d")
+_ACCOUNT_CODE_RE = re.compile(r"\s*(\d{6,12})\s+(.+)$")
+_TRAILING_AMOUNT_RE = re.compile(r"(?<![A-Za-z0-9])([\(\-]?\d[\d,]*(?:\.\d+)?-?\)?)\s*$")
+# Text allowed next to the lone amount in an amount-only cell (currency or Dr/Cr markers), lowercased.
+_AMOUNT_LEFTOVER = frozenset({"", "rs", "inr", "dr", "cr"})
+_HEADER_KEYWORDS = ("particular", "description", "head")
 _ACCOUNT_CODE_PREFIX_BASE = 110000000
 _ACCOUNT_CODE_STEP = 100
+_UPLOAD_CHUNK_SIZE = 1 << 20
+# Recent extractions keyed by upload sha256, so re-submitting the same PDF skips parsing it again.
+_EXTRACTION_CACHE_SIZE = 32
+_EXTRACTION_CACHE: OrderedDict[str, tuple[list[str], list[ExtractedTable]]] = OrderedDict()
+_EXTRACTION_CACHE_LOCK = threading.Lock()
 
 
 HTML_PAGE = """<!doctype html>
@@ -175,18 +196,25 @@ HTML_PAGE = """<!doctype html>
 </body>
 </html>
 """
+_HTML_BYTES = HTML_PAGE.encode("utf-8")
+_HTML_LENGTH = str(len(_HTML_BYTES))
 
 
 class DigitizationHandler(BaseHTTPRequestHandler):
     server_version = "AFSDigitizer/1.0"
-
-    def _send_html(self, body: str, status: HTTPStatus = HTTPStatus.OK) -> None:
-        encoded = body.encode("utf-8")
+    # Buffer wfile so the status line, headers and a small body leave in a single send; with that,
+    # Nagle's algorithm only adds latency, so turn it off.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    # (epoch second, formatted timestamp); replaced as a whole so concurrent handlers never see a torn pair.
+    _log_timestamp: tuple[int, str] = (-1, "")
+
+    def _send_html(self, body: bytes, content_length: str, status: HTTPStatus = HTTPStatus.OK) -> None:
         self.send_response(status)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(encoded)))
+        self.send_header("Content-Length", content_length)
         self.end_headers()
-        self.wfile.write(encoded)
+        self.wfile.write(body)
 
     def _send_text(self, body: str, status: HTTPStatus) -> None:
         encoded = body.encode("utf-8")
@@ -196,6 +224,48 @@ class DigitizationHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(encoded)
 
+    def _receive_pdf(self, target: Path, content_length: int) -> str | None:
+        """Stream the request body into ``target`` and return its sha256; None if it is not a PDF."""
+        head = self.rfile.read(min(4, content_length))
+        if not head.startswith(b"%PDF"):
+            return None
+        sha256 = hashlib.sha256(head)
+        with target.open("wb") as handle:
+            handle.write(head)
+            remaining = content_length - len(head)
+            while remaining > 0:
+                chunk = self.rfile.read(min(_UPLOAD_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                handle.write(chunk)
+                sha256.update(chunk)
+                remaining -= len(chunk)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def _cached_extraction(digest: str) -> tuple[list[str], list[ExtractedTable]] | None:
+        with _EXTRACTION_CACHE_LOCK:
+            cached = _EXTRACTION_CACHE.get(digest)
+            if cached is not None:
+                _EXTRACTION_CACHE.move_to_end(digest)
+            return cached
+
+    @staticmethod
+    def _remember_extraction(digest: str, extracted: tuple[list[str], list[ExtractedTable]]) -> None:
+        with _EXTRACTION_CACHE_LOCK:
+            _EXTRACTION_CACHE[digest] = extracted
+            if len(_EXTRACTION_CACHE) > _EXTRACTION_CACHE_SIZE:
+                _EXTRACTION_CACHE.popitem(last=False)
+
+    def log_date_time_string(self) -> str:
+        now = int(time.time())
+        second, text = DigitizationHandler._log_timestamp
+        if second != now:
+            year, month, day, hh, mm, ss, _, _, _ = time.localtime(now)
+            text = "%02d/%3s/%04d %02d:%02d:%02d" % (day, self.monthname[month], year, hh, mm, ss)
+            DigitizationHandler._log_timestamp = (now, text)
+        return text
+
     def log_message(self, format: str, *args: object) -> None:
         """Avoid connection drops when stderr is unavailable in some IDE run modes."""
         try:
@@ -210,8 +280,8 @@ class DigitizationHandler(BaseHTTPRequestHandler):
 
     def do_GET(self) -> None:  # noqa: N802
         try:
-            if urlparse(self.path).path == "/":
-                self._send_html(HTML_PAGE)
+            if self.path.partition("?")[0] == "/":
+                self._send_html(_HTML_BYTES, _HTML_LENGTH)
                 return
             self._send_text("Not Found", HTTPStatus.NOT_FOUND)
         except Exception:  # pragma: no cover - defensive error response
@@ -221,34 +291,35 @@ class DigitizationHandler(BaseHTTPRequestHandler):
     @staticmethod
     def _flatten_to_rows(payload: object) -> list[list[object]]:
         rows: list[list[object]] = [["Field", "Value"]]
+        # Children are pushed in reverse so popping the stack visits them in document order.
+        stack: list[tuple[str, object]] = [("", payload)]
+        pop, push = stack.pop, stack.extend
 
-        def walk(prefix: str, value: object) -> None:
+        while stack:
+            prefix, value = pop()
             if isinstance(value, dict):
                 if not value:
                     rows.append([prefix, ""])
-                    return
-                for key, nested in value.items():
-                    next_prefix = f"{prefix}.{key}" if prefix else key
-                    walk(next_prefix, nested)
-                return
-            if isinstance(value, list):
+                elif prefix:
+                    push([(f"{prefix}.{key}", nested) for key, nested in reversed(value.items())])
+                else:
+                    push(reversed(value.items()))
+            elif isinstance(value, list):
                 if not value:
                     rows.append([prefix, "[]"])
-                    return
-                for idx, nested in enumerate(value):
-                    walk(f"{prefix}[{idx}]", nested)
-                return
-            rows.append([prefix, "" if value is None else value])
+                else:
+                    push([(f"{prefix}[{idx}]", value[idx]) for idx in range(len(value) - 1, -1, -1)])
+            else:
+                rows.append([prefix, "" if value is None else value])
 
-        walk("", payload)
         return rows
 
     @staticmethod
     def _tables_to_rows(tables: list[ExtractedTable], page_texts: list[str]) -> list[list[object]]:
-        default_rows: list[list[object]] = [
-            ["Account Code", "Particulars", "Current Year Amount", "Previous Year Amount"]
-        ]
+        return list(DigitizationHandler._iter_rows(tables, page_texts))
 
+    @staticmethod
+    def _iter_rows(tables: list[ExtractedTable], page_texts: list[str]) -> Iterator[list[object]]:
         if tables:
             # Use the first parsed table to determine output headers.
             first_table_rows = DigitizationHandler._normalize_table_rows(tables[0].rows)
@@ -260,61 +331,63 @@ class DigitizationHandler(BaseHTTPRequestHandler):
                 table_title,
             )
 
-            rows: list[list[object]] = [
-                [
+            table_rows = DigitizationHandler._account_rows(
+                parsed
+                for table_idx, table in enumerate(tables)
+                for parsed in DigitizationHandler._table_data_rows(
+                    first_table_rows if table_idx == 0 else DigitizationHandler._normalize_table_rows(table.rows)
+                )
+            )
+            # Only commit to the table layout once a data row exists; otherwise fall back to page text.
+            first_row = next(table_rows, None)
+            if first_row is not None:
+                yield [
                     "Account Code",
                     particulars_header,
                     f"Current Year Amount ({current_label})",
                     f"Previous Year Amount ({previous_label})",
                 ]
-            ]
-
-            generated_index = 0
-            for table in tables:
-                parsed_rows = DigitizationHandler._table_data_rows(table)
-                for particulars, current_amount, previous_amount in parsed_rows:
-                    if not particulars and not current_amount and not previous_amount:
-                        continue
-                    account_code, cleaned_particulars = DigitizationHandler._extract_account_code(particulars)
-                    if not account_code:
-                        account_code = str(_ACCOUNT_CODE_PREFIX_BASE + (generated_index * _ACCOUNT_CODE_STEP))
-                    generated_index += 1
-                    rows.append([account_code, cleaned_particulars, current_amount, previous_amount])
-
-            if len(rows) > 1:
-                return rows
+                yield first_row
+                yield from table_rows
+                return
 
-        generated_index = 0
-        for page_text in page_texts:
-            for raw_line in page_text.splitlines():
-                line = raw_line.strip()
-                if not line:
-                    continue
-                particulars, current_amount, previous_amount = DigitizationHandler._split_particulars_and_amounts([line])
-                if not particulars and not current_amount and not previous_amount:
-                    continue
-                account_code, cleaned_particulars = DigitizationHandler._extract_account_code(particulars)
-                if not account_code:
-                    account_code = str(_ACCOUNT_CODE_PREFIX_BASE + (generated_index * _ACCOUNT_CODE_STEP))
-                generated_index += 1
-                default_rows.append([account_code, cleaned_particulars, current_amount, previous_amount])
+        yield ["Account Code", "Particulars", "Current Year Amount", "Previous Year Amount"]
+        text_rows = DigitizationHandler._account_rows(
+            DigitizationHandler._split_particulars_and_amounts([line])
+            for page_text in page_texts
+            for raw_line in page_text.splitlines()
+            if (line := raw_line.strip())
+        )
+        first_row = next(text_rows, None)
+        if first_row is None:
+            yield [str(_ACCOUNT_CODE_PREFIX_BASE), "No extractable text/table found in PDF", "", ""]
+            return
+        yield first_row
+        yield from text_rows
 
-        if len(default_rows) == 1:
-            default_rows.append([str(_ACCOUNT_CODE_PREFIX_BASE), "No extractable text/table found in PDF", "", ""])
-        return default_rows
+    @staticmethod
+    def _account_rows(parsed_rows: Iterable[tuple[str, str, str]]) -> Iterator[list[object]]:
+        generated_index = 0
+        for particulars, current_amount, previous_amount in parsed_rows:
+            if not particulars and not current_amount and not previous_amount:
+                continue
+            account_code, cleaned_particulars = DigitizationHandler._extract_account_code(particulars)
+            if not account_code:
+                account_code = str(_ACCOUNT_CODE_PREFIX_BASE + (generated_index * _ACCOUNT_CODE_STEP))
+            generated_index += 1
+            yield [account_code, cleaned_particulars, current_amount, previous_amount]
 
     @staticmethod
     def _normalize_table_rows(rows: list[list[str]]) -> list[list[str]]:
         normalized: list[list[str]] = []
         for row in rows:
-            clean_row = [cell.strip() for cell in row if cell and cell.strip()]
+            clean_row = [stripped for cell in row if cell and (stripped := cell.strip())]
             if clean_row:
                 normalized.append(clean_row)
         return normalized
 
     @staticmethod
-    def _table_data_rows(table: ExtractedTable) -> list[tuple[str, str, str]]:
-        normalized_rows = DigitizationHandler._normalize_table_rows(table.rows)
+    def _table_data_rows(normalized_rows: list[list[str]]) -> list[tuple[str, str, str]]:
         if not normalized_rows:
             return []
 
@@ -332,10 +405,9 @@ class DigitizationHandler(BaseHTTPRequestHandler):
             if len(row) < 2:
                 continue
             first = row[0].lower()
-            if "particular" in first or "description" in first or "head" in first:
+            if any(keyword in first for keyword in _HEADER_KEYWORDS):
                 return idx
-            period_like = sum(1 for cell in row[1:] if _YEAR_HEADER_RE.search(cell))
-            if period_like >= 1:
+            if any(_YEAR_HEADER_RE.search(cell) for cell in row[1:]):
                 return idx
         return None
 
@@ -352,11 +424,12 @@ class DigitizationHandler(BaseHTTPRequestHandler):
         if header_row_idx is None or header_row_idx >= len(rows):
             return particulars_label, current_label, previous_label
 
+        # Rows come from _normalize_table_rows, so every cell is already stripped and non-empty.
         header = rows[header_row_idx]
-        if header and header[0].strip():
-            particulars_label = header[0].strip()
+        if header:
+            particulars_label = header[0]
 
-        period_labels = [cell.strip() for cell in header[1:] if cell.strip()]
+        period_labels = header[1:]
         if len(period_labels) >= 2:
             current_label = period_labels[-2]
             previous_label = period_labels[-1]
@@ -376,17 +449,17 @@ class DigitizationHandler(BaseHTTPRequestHandler):
         if page_idx < 0 or page_idx >= len(page_texts):
             return "Particulars"
 
-        lines = [line.strip() for line in page_texts[page_idx].splitlines() if line.strip()]
+        lines = [stripped for line in page_texts[page_idx].splitlines() if (stripped := line.strip())]
         if not lines:
             return "Particulars"
 
         anchor = ""
         if header_row_idx is not None and header_row_idx < len(rows) and rows[header_row_idx]:
-            anchor = rows[header_row_idx][0].strip()
+            anchor = rows[header_row_idx][0].lower()
 
         if anchor:
             for idx, line in enumerate(lines):
-                if anchor.lower() in line.lower():
+                if anchor in line.lower():
                     for back in range(idx - 1, -1, -1):
                         if lines[back]:
                             return lines[back]
@@ -396,7 +469,7 @@ class DigitizationHandler(BaseHTTPRequestHandler):
 
     @staticmethod
     def _extract_account_code(particulars: str) -> tuple[str, str]:
-        match = re.match(r"^\s*(\d{6,12})\s+(.+)$", particulars)
+        match = _ACCOUNT_CODE_RE.match(particulars)
         if not match:
             return "", particulars
         return match.group(1), match.group(2).strip()
@@ -404,24 +477,37 @@ class DigitizationHandler(BaseHTTPRequestHandler):
     @staticmethod
     def _looks_like_amount(token: str) -> bool:
         stripped = token.strip()
-        digits = "".join(ch for ch in stripped if ch.isdigit())
-        if not digits:
+        if _DIGIT_RE.search(stripped) is None:
             return False
         if "," in stripped or "." in stripped or stripped.endswith("-") or stripped.startswith("(") or stripped.endswith(")"):
             return True
-        if len(digits) == 4:
-            year_value = int(digits)
-            if 1900 <= year_value <= 2099:
-                return False
-        return stripped.isdigit()
+        if not stripped.isdigit():
+            return False
+        return not (len(stripped) == 4 and 1900 <= int(stripped) <= 2099)
 
     @staticmethod
-    def _extract_amount_tokens(text: str) -> list[str]:
-        return [token for token in _AMOUNT_TOKEN_RE.findall(text) if DigitizationHandler._looks_like_amount(token)]
+    def _amount_only_token(cell: str) -> str | None:
+        """Return the cell's amount if it is the only one, allowing a currency or Dr/Cr marker; else None."""
+        found = None
+        for match in _AMOUNT_TOKEN_RE.finditer(cell):
+            token = match.group()
+            # Tokens always contain a digit and no whitespace, so _looks_like_amount reduces to these tests.
+            if token.isdigit():
+                if len(token) == 4 and 1900 <= int(token) <= 2099:
+                    continue
+            elif not ("," in token or "." in token or token[0] == "(" or token[-1] in "-)"):
+                continue
+            if found is not None:
+                return None
+            found = match
+        if found is None:
+            return None
+        leftover = (cell[: found.start()] + cell[found.end() :]).strip().lower()
+        return found.group() if leftover in _AMOUNT_LEFTOVER else None
 
     @staticmethod
     def _pop_trailing_amount(text: str) -> tuple[str, str]:
-        match = re.search(r"(?<![A-Za-z0-9])([\(\-]?\d[\d,]*(?:\.\d+)?-?\)?)[\s]*$", text)
+        match = _TRAILING_AMOUNT_RE.search(text)
         if not match:
             return text, ""
         token = match.group(1)
@@ -429,33 +515,23 @@ class DigitizationHandler(BaseHTTPRequestHandler):
             return text, ""
         return text[: match.start()].rstrip(), token
 
-    @staticmethod
-    def _is_amount_only_cell(cell: str) -> bool:
-        tokens = DigitizationHandler._extract_amount_tokens(cell)
-        if len(tokens) != 1:
-            return False
-        leftover = cell.replace(tokens[0], "", 1).strip().lower()
-        return leftover in {"", "rs", "inr", "dr", "cr"}
-
     @staticmethod
     def _split_particulars_and_amounts(row: list[str]) -> tuple[str, str, str]:
+        """Split a normalized row (stripped, non-empty cells) into particulars and up to two amounts."""
         if not row:
             return "", "", ""
 
-        clean_cells = [cell.strip() for cell in row if cell and cell.strip()]
-        if not clean_cells:
-            return "", "", ""
-
-        particulars_parts = [clean_cells[0]]
+        particulars_parts = [row[0]]
         detected_amounts: list[str] = []
 
-        for cell in clean_cells[1:]:
-            if DigitizationHandler._is_amount_only_cell(cell):
-                detected_amounts.extend(DigitizationHandler._extract_amount_tokens(cell))
+        for cell in row[1:]:
+            amount = DigitizationHandler._amount_only_token(cell)
+            if amount is not None:
+                detected_amounts.append(amount)
             else:
                 particulars_parts.append(cell)
 
-        particulars_text = " ".join(particulars_parts).strip()
+        particulars_text = " ".join(particulars_parts)
 
         # If the current-year amount is attached to the particulars cell, detach it.
         trailing_amounts: list[str] = []
@@ -475,11 +551,11 @@ class DigitizationHandler(BaseHTTPRequestHandler):
         elif len(all_amounts) == 1:
             current_amount = all_amounts[0]
 
-        return particulars_text.strip(), current_amount, previous_amount
+        return particulars_text, current_amount, previous_amount
 
     def do_POST(self) -> None:  # noqa: N802
         try:
-            if urlparse(self.path).path != "/digitize":
+            if self.path.partition("?")[0] != "/digitize":
                 self._send_text("Not Found", HTTPStatus.NOT_FOUND)
                 return
 
@@ -496,14 +572,11 @@ class DigitizationHandler(BaseHTTPRequestHandler):
             try:
                 content_length = int(length_header)
             except ValueError:
+                content_length = -1
+            if content_length < 0:
                 self._send_text("Invalid Content-Length", HTTPStatus.BAD_REQUEST)
                 return
 
-            pdf_data = self.rfile.read(content_length)
-            if not pdf_data.startswith(b"%PDF"):
-                self._send_text("Uploaded content is not a valid PDF", HTTPStatus.BAD_REQUEST)
-                return
-
             filename_header = unquote(self.headers.get("X-Filename", "uploaded.pdf"))
             safe_name = Path(filename_header).name
             if not safe_name.lower().endswith(".pdf"):
@@ -513,40 +586,121 @@ class DigitizationHandler(BaseHTTPRequestHandler):
                 temp_path = Path(temp_root)
                 pdf_path = temp_path / safe_name
                 output_root = temp_path / "out"
-                pdf_path.write_bytes(pdf_data)
-
-                page_texts = extract_page_texts(pdf_path)
-                extracted_tables = extract_tables(pdf_path, page_texts=page_texts)
-
-                runner = ETLJobRunner(output_root=output_root)
-                runner.run(file_paths=[pdf_path], page_texts=page_texts or [""])
+                digest = self._receive_pdf(pdf_path, content_length)
+                if digest is None:
+                    self._send_text("Uploaded content is not a valid PDF", HTTPStatus.BAD_REQUEST)
+                    return
 
                 out_name = f"{pdf_path.stem}_digitized.xlsx"
                 excel_path = temp_path / out_name
-                write_excel(excel_path, self._tables_to_rows(extracted_tables, page_texts))
-                excel_bytes = excel_path.read_bytes()
-
-                self.send_response(HTTPStatus.OK)
-                self.send_header(
-                    "Content-Type",
-                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                )
-                self.send_header("Content-Disposition", f'attachment; filename="{out_name}"')
-                self.send_header("Content-Length", str(len(excel_bytes)))
-                self.end_headers()
-                self.wfile.write(excel_bytes)
+                cached = self._cached_extraction(digest)
+                if isinstance(self.server, DigitizationServer):
+                    extracted = self.server.digitize(pdf_path, output_root, excel_path, cached)
+                else:
+                    extracted = _digitize_pdf(pdf_path, output_root, excel_path, cached)
+                if cached is None:
+                    self._remember_extraction(digest, extracted)
+
+                with excel_path.open("rb") as excel_file:
+                    self.send_response(HTTPStatus.OK)
+                    self.send_header(
+                        "Content-Type",
+                        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    )
+                    self.send_header("Content-Disposition", f'attachment; filename="{out_name}"')
+                    self.send_header("Content-Length", str(os.fstat(excel_file.fileno()).st_size))
+                    self.end_headers()
+                    self.wfile.flush()
+                    # Uses os.sendfile where available, so the workbook is never copied into Python memory.
+                    self.connection.sendfile(excel_file)
         except Exception as exc:  # pragma: no cover - defensive error response
             traceback.print_exc()
             self._send_text(f"Digitization failed: {exc}", HTTPStatus.INTERNAL_SERVER_ERROR)
 
 
+def _digitize_pdf(
+    pdf_path: Path,
+    output_root: Path,
+    excel_path: Path,
+    extracted: tuple[list[str], list[ExtractedTable]] | None = None,
+) -> tuple[list[str], list[ExtractedTable]]:
+    if extracted is None:
+        page_texts = extract_page_texts(pdf_path)
+        extracted = (page_texts, extract_tables(pdf_path, page_texts=page_texts))
+    page_texts, extracted_tables = extracted
+
+    # The output root is discarded with the temp dir, so an envelope cache entry could never be reused.
+    runner = ETLJobRunner(output_root=output_root, use_cache=False)
+    runner.run(file_paths=[pdf_path], page_texts=page_texts or [""])
+
+    write_excel(excel_path, DigitizationHandler._iter_rows(extracted_tables, page_texts))
+    return extracted
+
+
+class DigitizationServer(ThreadingHTTPServer):
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type[BaseHTTPRequestHandler],
+        workers: int = 1,
+    ) -> None:
+        self.workers = workers
+        self._executor_lock = threading.Lock()
+        self.digitize_executor = self._new_executor() if workers > 1 else None
+        super().__init__(server_address, handler_class)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # Spawned workers start from a fresh interpreter, so they never inherit the listening socket.
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def digitize(
+        self,
+        pdf_path: Path,
+        output_root: Path,
+        excel_path: Path,
+        extracted: tuple[list[str], list[ExtractedTable]] | None = None,
+    ) -> tuple[list[str], list[ExtractedTable]]:
+        executor = self.digitize_executor
+        if executor is None:
+            return _digitize_pdf(pdf_path, output_root, excel_path, extracted)
+        try:
+            # Parsing is CPU-bound; a worker process keeps concurrent uploads off this process's GIL.
+            return executor.submit(_digitize_pdf, pdf_path, output_root, excel_path, extracted).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); fail this request but give later ones a working pool.
+            with self._executor_lock:
+                if self.digitize_executor is executor:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self.digitize_executor = self._new_executor()
+            raise
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._executor_lock:
+            executor, self.digitize_executor = self.digitize_executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def _exit_on_sigterm(signum: int, frame: object) -> None:
+    raise SystemExit(0)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run local web uploader for PDF digitization.")
     parser.add_argument("--host", default="127.0.0.1", help="Host address to bind (default: 127.0.0.1)")
     parser.add_argument("--port", type=int, default=8080, help="Port to listen on (default: 8080)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for concurrent digitization; 1 runs it in the request thread (default: CPU count)",
+    )
     args = parser.parse_args(argv)
 
-    server = ThreadingHTTPServer((args.host, args.port), DigitizationHandler)
+    server = DigitizationServer((args.host, args.port), DigitizationHandler, workers=args.workers)
+    # Unwind through the finally below on SIGTERM too, so the worker pool is shut down with the server.
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
     print(f"Serving on http://{args.host}:{args.port}")
     try:
         server.serve_forever()